@@ -11,18 +11,44 @@ Usage:
 
 import json
 import os
+import queue
 import sys
+import threading
 import time
 from datetime import datetime
-from typing import Dict, List, Any
-from collections import Counter
+from typing import Dict, List, Any, Optional
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 import psycopg2
-from psycopg2.extras import Json
+from psycopg2.extras import Json, execute_values
 from dotenv import load_dotenv
 
+# Optional accelerator: Polars' multi-threaded ingest is much faster than
+# pandas for large monthly payloads, but the script works without it
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Optional accelerator: orjson decodes the large Socrata JSON pages a few
+# times faster than the stdlib parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional accelerator: accumulating pages as Arrow tables avoids holding
+# months of citations as millions of Python dicts
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 # Load environment variables
 load_dotenv('.env.local')
 
@@ -33,6 +59,17 @@ DATABASE_URL = os.getenv('DATABASE_URL') or os.getenv('POSTGRES_URL')
 BASE_URL = "https://data.sfgov.org/resource/ab4h-6ztd.json"
 SOCRATA_APP_TOKEN = os.getenv('SOCRATA_APP_TOKEN')
 
+# Shared session so paginated requests reuse TCP/TLS connections,
+# sized for one connection per concurrently-fetched month
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# How many months to download in parallel
+FETCH_WORKERS = 7
+
+# Plate values that mean "no plate" after normalization
+_INVALID_PLATES = frozenset({'NAN', 'NONE', 'NULL', ''})
+
 # Field mappings
 REQUIRED_FIELDS = [
     'citation_number',
@@ -46,8 +83,29 @@ REQUIRED_FIELDS = [
 ]
 
 
-def fetch_month_data(year: int, month: int) -> List[Dict]:
-    """Fetch data for a specific month"""
+def _decode_json(response: requests.Response) -> List[Dict]:
+    """Decode a Socrata JSON page, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _jsonb(obj) -> Json:
+    """Wrap a jsonb parameter, serializing with orjson when installed"""
+    if orjson is not None:
+        return Json(obj, dumps=lambda o: orjson.dumps(o, default=str).decode())
+    return Json(obj)
+
+
+def fetch_month_data(year: int, month: int) -> Any:
+    """
+    Fetch data for a specific month.
+
+    Returns a pyarrow Table when pyarrow is available (pages are parsed
+    straight into columnar form), otherwise a list of record dicts.
+    Either way len() gives the row count and clean_and_process_data
+    accepts the result.
+    """
     # Create date range for the month
     start_date = datetime(year, month, 1)
     if month == 12:
@@ -58,68 +116,130 @@ def fetch_month_data(year: int, month: int) -> List[Dict]:
     start_str = start_date.strftime('%Y-%m-%dT00:00:00.000')
     end_str = end_date.strftime('%Y-%m-%dT00:00:00.000')
     
+    # Keyset pagination: each page filters past the previous page's last
+    # (datetime, citation_number) key instead of using $offset, which
+    # makes page N O(page) server-side rather than O(N * page)
+    base_where = f"citation_issued_datetime >= '{start_str}' AND citation_issued_datetime < '{end_str}'"
     params = {
         '$limit': 10000,  # Smaller batch size to avoid timeouts
-        '$offset': 0,
-        '$order': 'citation_issued_datetime DESC',
-        '$where': f"citation_issued_datetime >= '{start_str}' AND citation_issued_datetime < '{end_str}'",
+        '$order': 'citation_issued_datetime DESC, citation_number DESC',
+        '$where': base_where,
         '$select': ','.join(REQUIRED_FIELDS)
     }
-    
+
     headers = {}
     if SOCRATA_APP_TOKEN:
         headers['X-App-Token'] = SOCRATA_APP_TOKEN
-    
+
     print(f"  📡 Fetching {year}-{month:02d} data...")
     print(f"     Date range: {start_str} to {end_str}")
-    
-    all_data = []
-    offset = 0
-    
+
+    pages = []  # Arrow tables when pyarrow is available, else raw lists
+    fetched = 0
+
     while True:
-        params['$offset'] = offset
-        
         try:
-            response = requests.get(BASE_URL, params=params, headers=headers, timeout=60)
+            response = SESSION.get(BASE_URL, params=params, headers=headers, timeout=60)
             response.raise_for_status()
-            data = response.json()
-            
+            data = _decode_json(response)
+
             if not data:
                 break
-                
-            all_data.extend(data)
-            offset += len(data)
-            
-            print(f"     Fetched {len(data):,} records (total: {len(all_data):,})")
-            
+
+            # Convert each page to columnar form right away so the raw
+            # dicts can be garbage-collected page by page
+            pages.append(pa.Table.from_pylist(data) if pa is not None else data)
+            fetched += len(data)
+
+            print(f"     Fetched {len(data):,} records (total: {fetched:,})")
+
             # If we got fewer records than requested, we've reached the end
             if len(data) < params['$limit']:
                 break
-                
+
+            # Advance the keyset cursor past the last row of this page
+            last = data[-1]
+            last_dt = last.get('citation_issued_datetime')
+            last_citation = last.get('citation_number')
+            if not last_dt or not last_citation:
+                break
+            params['$where'] = (
+                f"{base_where} AND (citation_issued_datetime < '{last_dt}'"
+                f" OR (citation_issued_datetime = '{last_dt}'"
+                f" AND citation_number < '{last_citation}'))"
+            )
+
             # Rate limiting
             time.sleep(1)
-            
+
         except requests.exceptions.Timeout:
-            print(f"     ⚠️  Timeout fetching batch at offset {offset}, continuing with {len(all_data)} records...")
+            print(f"     ⚠️  Timeout fetching batch, continuing with {fetched} records...")
             break
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError covers orjson/json decode errors on a malformed
+            # page, which response.json() used to raise as a
+            # RequestException subclass
             print(f"     ❌ Error fetching data: {e}")
             break
-    
-    print(f"  ✅ Total records for {year}-{month:02d}: {len(all_data):,}")
-    return all_data
 
+    print(f"  ✅ Total records for {year}-{month:02d}: {fetched:,}")
 
-def clean_and_process_data(raw_data: List[Dict]) -> pd.DataFrame:
-    """Clean and process raw citation data"""
-    if not raw_data:
+    if pa is not None:
+        if not pages:
+            return pa.table({})
+        # Null-only fields can be omitted per page; permissive promotion
+        # unifies the page schemas
+        return pa.concat_tables(pages, promote_options='permissive')
+
+    return [record for page in pages for record in page]
+
+
+def _load_fast(raw_data: List[Dict]) -> Optional[pd.DataFrame]:
+    """
+    Build the citations frame with Polars' multi-threaded parsers.
+
+    Returns None if Polars is unavailable or cannot handle the payload,
+    in which case the caller falls back to plain pandas.
+    """
+    if pl is None:
+        return None
+
+    try:
+        lf = pl.from_dicts(raw_data, infer_schema_length=None).lazy()
+        columns = lf.collect_schema().names()
+
+        casts = []
+        if 'citation_issued_datetime' in columns:
+            casts.append(
+                pl.col('citation_issued_datetime').str.strptime(pl.Datetime, strict=False)
+            )
+        if 'fine_amount' in columns:
+            casts.append(
+                pl.col('fine_amount').cast(pl.Float64, strict=False).fill_null(0.0)
+            )
+        if casts:
+            lf = lf.with_columns(casts)
+
+        return lf.collect().to_pandas()
+    except Exception:
+        return None
+
+
+def clean_and_process_data(raw_data: Any) -> pd.DataFrame:
+    """Clean and process raw citation data (an Arrow table or record dicts)"""
+    if raw_data is None or len(raw_data) == 0:
         return pd.DataFrame()
-    
-    df = pd.DataFrame(raw_data)
-    
-    # Convert date column
+
+    if pa is not None and isinstance(raw_data, pa.Table):
+        df = raw_data.to_pandas()
+    else:
+        df = _load_fast(raw_data)
+        if df is None:
+            df = pd.DataFrame(raw_data)
+
+    # Convert date column (no-op when the fast path already parsed it)
     df['citation_issued_datetime'] = pd.to_datetime(df['citation_issued_datetime'], errors='coerce')
-    
+
     # Convert fine_amount to numeric
     df['fine_amount'] = pd.to_numeric(df['fine_amount'], errors='coerce').fillna(0.0)
     
@@ -128,171 +248,225 @@ def clean_and_process_data(raw_data: List[Dict]) -> pd.DataFrame:
     df['longitude'] = None
     
     if 'the_geom' in df.columns:
-        def extract_coords(geom):
-            if pd.isna(geom) or not isinstance(geom, dict):
-                return None, None
-            try:
-                coords = geom.get('coordinates', [])
-                if len(coords) == 2:
-                    return coords[1], coords[0]  # lat, lon
-            except:
-                pass
-            return None, None
-        
-        coords = df['the_geom'].apply(extract_coords)
-        df['latitude'] = coords.apply(lambda x: x[0])
-        df['longitude'] = coords.apply(lambda x: x[1])
-    
-    # Clean plate numbers
-    df['vehicle_plate'] = df['vehicle_plate'].astype(str).str.strip().str.upper()
-    df = df[df['vehicle_plate'].str.len() > 0]
-    df = df[~df['vehicle_plate'].isin(['NAN', 'NONE', 'NULL', ''])]
-    
-    # Drop rows with missing critical data
-    df = df.dropna(subset=['vehicle_plate', 'citation_issued_datetime'])
+        # Unpack GeoJSON Point dicts in one vectorized pass instead of
+        # three row-wise .apply calls
+        geom = df['the_geom'].dropna()
+        geom = geom[[isinstance(g, dict) for g in geom]]
+        if not geom.empty:
+            coords = pd.DataFrame(geom.tolist(), index=geom.index).get('coordinates')
+            if coords is not None:
+                valid = coords[[isinstance(c, (list, tuple, np.ndarray)) and len(c) == 2 for c in coords]]
+                if not valid.empty:
+                    # GeoJSON order is [longitude, latitude]
+                    arr = np.array(valid.tolist(), dtype=float)
+                    df.loc[valid.index, 'longitude'] = arr[:, 0]
+                    df.loc[valid.index, 'latitude'] = arr[:, 1]
     
+    # Clean plate numbers and drop rows with missing critical data in a
+    # single fused mask: one filtered frame instead of three intermediates
+    plate_clean = df['vehicle_plate'].astype(str).str.strip().str.upper()
+    mask = (
+        plate_clean.str.len().gt(0)
+        & ~plate_clean.isin(_INVALID_PLATES)
+        & df['citation_issued_datetime'].notna()
+    )
+    df = df.assign(vehicle_plate=plate_clean).loc[mask]
+
     # Remove duplicates
     if 'citation_number' in df.columns:
         df = df.drop_duplicates(subset=['citation_number'], keep='first')
-    
+
+    # Format ISO date strings once, vectorized; the aggregation reads
+    # this column instead of formatting timestamps per citation
+    dates = df['citation_issued_datetime']
+    df['date_iso'] = dates.dt.strftime('%Y-%m-%dT%H:%M:%S').astype(object).where(dates.notna(), None)
+
+    # Violation text is a group key later; normalize missing values before
+    # the categorical cast so 'Unknown' is a real category
+    if 'violation_desc' in df.columns:
+        df['violation_desc'] = df['violation_desc'].fillna('Unknown')
+
+    # Cast the group-key columns to category so the downstream groupbys
+    # hash int codes instead of Python strings
+    for col in ('vehicle_plate', 'violation_desc', 'vehicle_plate_state'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
     return df
 
 
 def aggregate_by_plate(df: pd.DataFrame) -> Dict[str, Dict]:
-    """Aggregate citations by plate"""
+    """Aggregate citations by plate using vectorized groupby operations"""
+    if df.empty:
+        return {}
+
+    # Sort once (plate ascending, date descending) so each plate's citations
+    # come out newest-first and its records can be sliced contiguously
+    df = df.sort_values(
+        ['vehicle_plate', 'citation_issued_datetime'],
+        ascending=[True, False],
+        kind='mergesort'
+    ).reset_index(drop=True)
+
+    # Per-plate aggregates in one C-level pass (observed=True keeps
+    # categorical groupbys to the plates actually present)
+    aggregates = df.groupby('vehicle_plate', observed=True).agg(
+        total_fines=('fine_amount', 'sum'),
+        citation_count=('fine_amount', 'size')
+    )
+
+    # Modal violation per plate: count (plate, violation) pairs once,
+    # then keep the highest count per plate — no per-plate Python at all
+    if 'violation_desc' in df.columns:
+        favorite_violations = (
+            df.groupby(['vehicle_plate', 'violation_desc'], observed=True)
+            .size()
+            .sort_values(ascending=False)
+            .reset_index()
+            .drop_duplicates('vehicle_plate')
+            .set_index('vehicle_plate')['violation_desc']
+        )
+    else:
+        favorite_violations = pd.Series('Unknown', index=aggregates.index)
+
+    # Modal plate state per plate, same single-pass trick
+    if 'vehicle_plate_state' in df.columns:
+        plate_states = (
+            df.groupby(['vehicle_plate', 'vehicle_plate_state'], observed=True)
+            .size()
+            .sort_values(ascending=False)
+            .reset_index()
+            .drop_duplicates('vehicle_plate')
+            .set_index('vehicle_plate')['vehicle_plate_state']
+        )
+    else:
+        plate_states = pd.Series('CA', index=aggregates.index)
+
+    # Build all citation dicts in a single to_dict('records') pass,
+    # reusing the ISO strings prepared during cleaning when present
+    if 'date_iso' in df.columns:
+        date_iso = df['date_iso']
+    else:
+        dates = df['citation_issued_datetime']
+        date_iso = dates.dt.strftime('%Y-%m-%dT%H:%M:%S').astype(object).where(dates.notna(), None)
+
+    records_df = pd.DataFrame({
+        'citation_number': df['citation_number'].astype(str) if 'citation_number' in df.columns else '',
+        'date': date_iso,
+        'violation': df['violation_desc'].astype(str) if 'violation_desc' in df.columns else 'Unknown',
+        'location': df['citation_location'].fillna('').astype(str) if 'citation_location' in df.columns else '',
+        'fine_amount': df['fine_amount'].astype(float)
+    })
+    citation_records = records_df.to_dict(orient='records')
+
+    # Attach coordinates only where both are present (same shape as
+    # before). Coercing to float arrays up front keeps the validity mask
+    # in numpy instead of per-row pd.notna dispatch on object columns
+    latitudes = pd.to_numeric(df['latitude'], errors='coerce').to_numpy(dtype=float)
+    longitudes = pd.to_numeric(df['longitude'], errors='coerce').to_numpy(dtype=float)
+    has_coords = ~np.isnan(latitudes) & ~np.isnan(longitudes)
+    for i in has_coords.nonzero()[0]:
+        citation_records[i]['latitude'] = float(latitudes[i])
+        citation_records[i]['longitude'] = float(longitudes[i])
+
+    # Slice the shared records list per plate. The frame is sorted by
+    # plate, so searchsorted gives each plate's contiguous [start, stop)
+    # range without materializing per-group index arrays
+    plates = df['vehicle_plate'].to_numpy()
+    unique_plates = aggregates.index.to_numpy()
+    starts = np.searchsorted(plates, unique_plates, side='left')
+    stops = np.append(starts[1:], len(plates))
+
     plate_data = {}
-    grouped = df.groupby('vehicle_plate')
-    
-    for plate, group in grouped:
+    total_fines_by_plate = aggregates['total_fines'].to_dict()
+    citation_count_by_plate = aggregates['citation_count'].to_dict()
+    favorite_by_plate = favorite_violations.to_dict()
+    state_by_plate = plate_states.to_dict()
+
+    for k, plate in enumerate(unique_plates):
         if not plate or plate == '' or pd.isna(plate):
             continue
-        
-        total_fines = float(group['fine_amount'].sum())
-        citation_count = len(group)
-        
-        # Get plate state
-        plate_state = 'CA'
-        if 'vehicle_plate_state' in group.columns:
-            state_counts = group['vehicle_plate_state'].value_counts()
-            if len(state_counts) > 0:
-                plate_state = state_counts.index[0]
-        
-        # Store all citations
-        all_citations = []
-        for _, row in group.iterrows():
-            citation = {
-                'citation_number': str(row.get('citation_number', '')),
-                'date': row['citation_issued_datetime'].isoformat() if pd.notna(row['citation_issued_datetime']) else None,
-                'violation': str(row.get('violation_desc', 'Unknown')),
-                'location': str(row.get('citation_location', '')),
-                'fine_amount': float(row.get('fine_amount', 0.0))
-            }
-            
-            if pd.notna(row.get('latitude')) and pd.notna(row.get('longitude')):
-                citation['latitude'] = float(row['latitude'])
-                citation['longitude'] = float(row['longitude'])
-            
-            all_citations.append(citation)
-        
-        # Sort by date
-        all_citations.sort(key=lambda x: x['date'] or '', reverse=True)
-        
-        # Calculate favorite violation
-        violations = [c['violation'] for c in all_citations]
-        violation_counts = Counter(violations)
-        favorite_violation = violation_counts.most_common(1)[0][0] if violations else 'Unknown'
-        
+
         plate_data[plate] = {
-            'total_fines': total_fines,
-            'citation_count': citation_count,
-            'plate_state': plate_state,
-            'favorite_violation': favorite_violation,
-            'all_citations': all_citations
+            'total_fines': float(total_fines_by_plate[plate]),
+            'citation_count': int(citation_count_by_plate[plate]),
+            'plate_state': state_by_plate.get(plate, 'CA'),
+            'favorite_violation': favorite_by_plate.get(plate, 'Unknown'),
+            'all_citations': citation_records[starts[k]:stops[k]]
         }
-    
+
     return plate_data
 
 
-def store_month_data(plate_data: Dict[str, Dict], year: int, month: int):
-    """Store processed data for a month in the database"""
-    conn = psycopg2.connect(DATABASE_URL)
+def store_month_data(plate_data: Dict[str, Dict], year: int, month: int, conn):
+    """Store processed data for a month over the shared connection"""
     cur = conn.cursor()
-    
+
     try:
         print(f"  💾 Storing {year}-{month:02d} data in database...")
-        
-        # Store plate details
-        stored_count = 0
-        for plate, data in plate_data.items():
-            cur.execute("""
-                INSERT INTO plate_details (plate, total_fines, citation_count, plate_state, favorite_violation, citations)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (plate) DO UPDATE SET
-                    total_fines = plate_details.total_fines + EXCLUDED.total_fines,
-                    citation_count = plate_details.citation_count + EXCLUDED.citation_count,
-                    citations = plate_details.citations || EXCLUDED.citations
-            """, (
+
+        # Batch all plates into multi-row INSERTs instead of one
+        # round trip per plate
+        rows = [
+            (
                 plate,
                 data['total_fines'],
                 data['citation_count'],
                 data['plate_state'],
                 data['favorite_violation'],
-                Json(data['all_citations'])
-            ))
-            stored_count += 1
-            
-            if stored_count % 1000 == 0:
-                conn.commit()
-                print(f"     Stored {stored_count:,} plates...")
-        
+                _jsonb(data['all_citations'])
+            )
+            for plate, data in plate_data.items()
+        ]
+
+        execute_values(cur, """
+            INSERT INTO plate_details (plate, total_fines, citation_count, plate_state, favorite_violation, citations)
+            VALUES %s
+            ON CONFLICT (plate) DO UPDATE SET
+                total_fines = plate_details.total_fines + EXCLUDED.total_fines,
+                citation_count = plate_details.citation_count + EXCLUDED.citation_count,
+                citations = plate_details.citations || EXCLUDED.citations
+            WHERE EXCLUDED.citation_count > 0
+        """, rows, page_size=1000)
+
         conn.commit()
-        print(f"  ✅ Stored {stored_count:,} plates for {year}-{month:02d}")
+        print(f"  ✅ Stored {len(rows):,} plates for {year}-{month:02d}")
         
     except Exception as e:
         print(f"  ❌ Error storing data: {e}")
         conn.rollback()
     finally:
         cur.close()
-        conn.close()
 
 
-def update_leaderboard():
+def update_leaderboard(conn):
     """Update the leaderboard with current data"""
-    conn = psycopg2.connect(DATABASE_URL)
     cur = conn.cursor()
-    
+
     try:
         print("  🏆 Updating leaderboard...")
-        
-        # Clear old leaderboard
+
+        # Rebuild server-side in one transaction: the top-30 rows never
+        # round-trip through Python
         cur.execute("DELETE FROM leaderboard")
-        
-        # Get top 30 plates by total fines
         cur.execute("""
-            SELECT plate, total_fines, citation_count
+            INSERT INTO leaderboard (rank, plate, total_fines, citation_count)
+            SELECT row_number() OVER (ORDER BY total_fines DESC, citation_count DESC),
+                   plate, total_fines, citation_count
             FROM plate_details
             ORDER BY total_fines DESC, citation_count DESC
             LIMIT 30
         """)
-        
-        top_plates = cur.fetchall()
-        
-        # Insert new leaderboard
-        for rank, (plate, total_fines, citation_count) in enumerate(top_plates, 1):
-            cur.execute("""
-                INSERT INTO leaderboard (rank, plate, total_fines, citation_count)
-                VALUES (%s, %s, %s, %s)
-            """, (rank, plate, total_fines, citation_count))
-        
+        inserted = cur.rowcount
+
         conn.commit()
-        print(f"  ✅ Updated leaderboard with {len(top_plates)} entries")
+        print(f"  ✅ Updated leaderboard with {inserted} entries")
         
     except Exception as e:
         print(f"  ❌ Error updating leaderboard: {e}")
         conn.rollback()
     finally:
         cur.close()
-        conn.close()
 
 
 def main():
@@ -306,43 +480,103 @@ def main():
     processed_months = 0
     
     try:
-        # Process each month from January to July 2025
-        for month in range(1, 8):  # 1 to 7 (January to July)
-            print(f"\n📅 Processing 2025-{month:02d}")
-            print("-" * 30)
-            
-            # Fetch data for this month
-            raw_data = fetch_month_data(2025, month)
-            
-            if not raw_data:
-                print(f"  ⚠️  No data found for 2025-{month:02d}")
-                continue
-            
-            # Process the data
-            df = clean_and_process_data(raw_data)
-            if df.empty:
-                print(f"  ⚠️  No valid data after cleaning for 2025-{month:02d}")
-                continue
-            
-            # Aggregate by plate
-            plate_data = aggregate_by_plate(df)
-            if not plate_data:
-                print(f"  ⚠️  No plate data for 2025-{month:02d}")
-                continue
-            
-            # Store in database
-            store_month_data(plate_data, 2025, month)
-            
-            total_citations += len(raw_data)
-            processed_months += 1
-            
-            print(f"  ✅ Completed 2025-{month:02d}")
-            
-            # Rate limiting between months
-            time.sleep(1)
-        
-        # Update leaderboard
-        update_leaderboard()
+        # Three-stage pipeline: downloads, pandas aggregation, and DB
+        # writes each run in their own stage so a month's HTTP wait
+        # overlaps the previous month's processing and store. Bounded
+        # queues cap how many months of raw data sit in memory.
+        raw_q: queue.Queue = queue.Queue(maxsize=2)
+        processed_q: queue.Queue = queue.Queue(maxsize=2)
+
+        # Exceptions raised inside the stage threads, re-raised on the
+        # main thread after the joins; the sentinels go in finally so a
+        # failing stage can never leave its consumer blocked on .get()
+        stage_errors: List[BaseException] = []
+
+        def fetch_stage():
+            """Download all months concurrently and feed them downstream"""
+            try:
+                with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+                    futures = {
+                        executor.submit(fetch_month_data, 2025, month): month
+                        for month in range(1, 8)  # 1 to 7 (January to July)
+                    }
+                    for future in as_completed(futures):
+                        raw_q.put((futures[future], future.result()))
+            except BaseException as e:
+                stage_errors.append(e)
+            finally:
+                raw_q.put(None)  # Sentinel: no more months
+
+        def process_stage():
+            """Clean and aggregate each month as its download lands"""
+            try:
+                while True:
+                    item = raw_q.get()
+                    if item is None:
+                        break
+                    month, raw_data = item
+
+                    print(f"\n📅 Processing 2025-{month:02d}")
+                    print("-" * 30)
+
+                    if not raw_data:
+                        print(f"  ⚠️  No data found for 2025-{month:02d}")
+                        continue
+
+                    df = clean_and_process_data(raw_data)
+                    if df.empty:
+                        print(f"  ⚠️  No valid data after cleaning for 2025-{month:02d}")
+                        continue
+
+                    plate_data = aggregate_by_plate(df)
+                    if not plate_data:
+                        print(f"  ⚠️  No plate data for 2025-{month:02d}")
+                        continue
+
+                    processed_q.put((month, len(raw_data), plate_data))
+            except BaseException as e:
+                stage_errors.append(e)
+                # Keep draining so the fetcher can't stay blocked on the
+                # bounded queue; remaining months are discarded
+                while raw_q.get() is not None:
+                    pass
+            finally:
+                processed_q.put(None)
+
+        fetcher = threading.Thread(target=fetch_stage, name='fetcher')
+        processor = threading.Thread(target=process_stage, name='processor')
+        fetcher.start()
+        processor.start()
+
+        # Writer stage runs on the main thread, reusing one connection
+        # for every month plus the leaderboard rebuild
+        conn = psycopg2.connect(DATABASE_URL)
+        try:
+            while True:
+                item = processed_q.get()
+                if item is None:
+                    break
+                month, raw_count, plate_data = item
+
+                store_month_data(plate_data, 2025, month, conn)
+
+                total_citations += raw_count
+                processed_months += 1
+
+                print(f"  ✅ Completed 2025-{month:02d}")
+
+            fetcher.join()
+            processor.join()
+
+            # Surface whatever killed a stage instead of finishing
+            # quietly on partial data
+            if stage_errors:
+                raise stage_errors[0]
+
+            # Update leaderboard
+            update_leaderboard(conn)
+        finally:
+            conn.close()
         
         elapsed = time.time() - start_time
         print("\n" + "=" * 60)
@@ -25,4 +25,6 @@ CREATE TABLE IF NOT EXISTS citation_hotspots (
 );
 
 CREATE INDEX IF NOT EXISTS idx_plate_details_state ON plate_details(plate_state);
+-- Serves the leaderboard's ORDER BY ... LIMIT as an index scan
+CREATE INDEX IF NOT EXISTS idx_plate_details_total_fines ON plate_details(total_fines DESC, citation_count DESC);
 CREATE INDEX IF NOT EXISTS idx_hotspots_count ON citation_hotspots(citation_count DESC);